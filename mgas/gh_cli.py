@@ -77,7 +77,8 @@ class GitHubCLI:
         gh = self.ensure()
         hidden_run([gh, "auth", "switch", "--user", username], check=True)
 
-    def auth_status(self) -> str:
+    def probe_active_user(self) -> str | None:
+        """Run a single `gh auth status` and return the active username, if any."""
         gh = self.ensure()
         result = hidden_run([gh, "auth", "status"], capture_output=True, text=True)
         
@@ -85,7 +86,6 @@ class GitHubCLI:
         output = result.stdout + result.stderr
         lines = output.splitlines()
         
-        active_username = None
         for i, line in enumerate(lines):
             if "Logged in to github.com account" in line and i + 1 < len(lines):
                 # Check next line for active status
@@ -94,36 +94,22 @@ class GitHubCLI:
                     # Extract username from current line
                     parts = line.split("account")
                     if len(parts) > 1:
-                        username = parts[1].strip().split()[0]
-                        active_username = username
-                        break
-        
+                        return parts[1].strip().split()[0]
+        return None
+
+    @staticmethod
+    def format_status(active_username: str | None) -> str:
         if active_username:
             return f"Current Active: {active_username}"
-        else:
-            return "GitHub CLI available - No active account"
+        return "GitHub CLI available - No active account"
+
+    def auth_status(self) -> str:
+        return self.format_status(self.probe_active_user())
 
     def get_active_user(self) -> str | None:
         """Get the currently active GitHub username."""
         try:
-            gh = self.ensure()
-            result = hidden_run([gh, "auth", "status"], capture_output=True, text=True)
-            
-            # Parse the output to find active account
-            output = result.stdout + result.stderr
-            lines = output.splitlines()
-            
-            for i, line in enumerate(lines):
-                if "Logged in to github.com account" in line and i + 1 < len(lines):
-                    # Check next line for active status
-                    next_line = lines[i + 1]
-                    if "Active account: true" in next_line:
-                        # Extract username from current line
-                        parts = line.split("account")
-                        if len(parts) > 1:
-                            username = parts[1].strip().split()[0]
-                            return username
-            return None
+            return self.probe_active_user()
         except Exception:
             return None
 
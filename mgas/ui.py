@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import queue
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 import customtkinter as ctk
@@ -13,6 +15,9 @@ from .gh_cli import GitHubCLI, RepoBootstrapper
 ctk.set_appearance_mode("System")
 ctk.set_default_color_theme("blue")
 
+# How often the Tk loop checks for a finished background switch.
+SWITCH_POLL_MS = 50
+
 
 def resource_path(*relative_parts: str) -> Path:
     """Resolve resources both in source tree and within PyInstaller bundles."""
@@ -28,6 +33,15 @@ class AccountSwitcherApp:
         self.repo_bootstrapper = RepoBootstrapper(self.gh_cli)
         self._icon_image: PhotoImage | None = None
 
+        # Switch pipeline state: clicks only replace the pending target, a single
+        # worker drains it, and results come back to the Tk thread via a queue.
+        self._switch_lock = threading.Lock()
+        self._pending_switch: Account | None = None
+        self._switch_worker: threading.Thread | None = None
+        self._switch_results: queue.Queue = queue.Queue()
+        # Last identity gh actually reported; failed pipelines roll back to it.
+        self._confirmed_username: str | None = None
+
         self.app = ctk.CTk()
         self.app.title("Multi-GitHub Account Switcher")
         self.app.geometry("920x680")
@@ -36,7 +50,6 @@ class AccountSwitcherApp:
 
         self._apply_branding()
         self._build_layout()
-        self.refresh_list()
         self.update_status()
 
     def _apply_branding(self):
@@ -192,28 +205,37 @@ class AccountSwitcherApp:
         self.app.mainloop()
 
     def refresh_list(self):
+        self._render_list(self._get_active_username())
+
+    def _render_list(self, active_username: str | None):
         for row in self.tree.get_children():
             self.tree.delete(row)
         
-        # Get the active username
-        active_username = self._get_active_username()
-        
         for account in self.account_store.all():
             # Mark active account with a checkmark
             status = "✓" if account.username == active_username else ""
             self.tree.insert("", "end", iid=account.label, values=(status, account.label, account.username, account.name, account.email))
 
+    def _mark_active(self, active_username: str | None):
+        """Move the active checkmark in place without rebuilding the table."""
+        for row in self.tree.get_children():
+            account = self.account_store.get(row)
+            status = "✓" if account and account.username == active_username else ""
+            self.tree.set(row, "Status", status)
+
     def update_status(self):
+        # A single `gh auth status` feeds both the banner and the table.
+        active_username = None
         try:
-            status_text = self.gh_cli.auth_status()
-            self.status_label.configure(text=status_text)
+            active_username = self.gh_cli.probe_active_user()
+            self._confirmed_username = active_username
+            self.status_label.configure(text=self.gh_cli.format_status(active_username))
         except FileNotFoundError:
             self.status_label.configure(text="GitHub CLI not installed")
         except Exception as e:
             self.status_label.configure(text=f"Error checking status: {str(e)}")
         
-        # Refresh the list to update active indicators
-        self.refresh_list()
+        self._render_list(active_username)
     
     def _get_active_username(self) -> str | None:
         """Get the currently active GitHub username from gh CLI."""
@@ -279,14 +301,104 @@ class AccountSwitcherApp:
         account = self._selected_account()
         if not account:
             return
+
+        with self._switch_lock:
+            # A newer click simply replaces a target the worker has not picked up yet.
+            self._pending_switch = account
+            start_worker = self._switch_worker is None
+            if start_worker:
+                self._switch_worker = threading.Thread(target=self._run_switch_pipeline, daemon=True)
+
+        # Optimistic update: show the target as active before gh confirms it.
+        self._mark_active(account.username)
+        self.status_label.configure(text=f"Switching to {account.username}...")
+
+        if start_worker:
+            self._switch_worker.start()
+            self.app.after(SWITCH_POLL_MS, self._poll_switch_result)
+
+    def _run_switch_pipeline(self):
+        """Worker thread: apply the latest requested switch, then verify once."""
+        target: Account | None = None
+        error: Exception | None = None
+        reported = False
         try:
-            self.gh_cli.switch_user(account.username)
-            self.update_status()
-            messagebox.showinfo("Success", f"Switched global auth to {account.label} ({account.username})")
-        except FileNotFoundError:
+            while True:
+                with self._switch_lock:
+                    account = self._pending_switch
+                    self._pending_switch = None
+                if account is not None:
+                    target = account
+                    try:
+                        self.gh_cli.switch_user(account.username)
+                        error = None
+                    except Exception as err:
+                        error = err
+                    continue
+
+                probe_error: Exception | None = None
+                active_username = None
+                try:
+                    active_username = self.gh_cli.probe_active_user()
+                except Exception as err:
+                    probe_error = err
+
+                with self._switch_lock:
+                    if self._pending_switch is not None:
+                        # Superseded while probing; the next pass verifies instead.
+                        continue
+                    self._switch_worker = None
+                    self._switch_results.put((target, error, active_username, probe_error))
+                    reported = True
+                    return
+        except Exception as err:
+            error = err
+        finally:
+            if not reported:
+                # Never leave the UI waiting on a dead worker: report the failure
+                # so the poll rolls back, and drop any target queued meanwhile.
+                with self._switch_lock:
+                    self._pending_switch = None
+                    self._switch_worker = None
+                    self._switch_results.put((target, error, None, error or RuntimeError("Switch pipeline stopped")))
+
+    def _poll_switch_result(self):
+        try:
+            target, error, active_username, probe_error = self._switch_results.get_nowait()
+        except queue.Empty:
+            self.app.after(SWITCH_POLL_MS, self._poll_switch_result)
+            return
+
+        with self._switch_lock:
+            superseded = self._switch_worker is not None
+
+        if superseded:
+            # Results of superseded pipelines are dropped on purpose: the running
+            # pipeline will verify and report the final state. A missing CLI is
+            # still surfaced since the newer pipeline cannot fix that.
+            if isinstance(error, FileNotFoundError) or isinstance(probe_error, FileNotFoundError):
+                messagebox.showerror("GitHub CLI Missing", "Install GitHub CLI to switch accounts.")
+            return
+
+        if probe_error is None:
+            self._confirmed_username = active_username
+            self._mark_active(active_username)
+            self.status_label.configure(text=self.gh_cli.format_status(active_username))
+        else:
+            self._mark_active(self._confirmed_username)
+            if isinstance(probe_error, FileNotFoundError):
+                self.status_label.configure(text="GitHub CLI not installed")
+            else:
+                self.status_label.configure(text=f"Error checking status: {str(probe_error)}")
+
+        if isinstance(error, FileNotFoundError):
             messagebox.showerror("GitHub CLI Missing", "Install GitHub CLI to switch accounts.")
-        except subprocess.CalledProcessError as err:
-            messagebox.showerror("Error", f"Switch failed: {err.stderr or err.stdout or err}")
+        elif isinstance(error, subprocess.CalledProcessError):
+            messagebox.showerror("Error", f"Switch failed: {error.stderr or error.stdout or error}")
+        elif error is not None:
+            messagebox.showerror("Error", f"Switch failed: {error}")
+        elif probe_error is None and target is not None and active_username != target.username:
+            messagebox.showerror("Error", f"Switch failed: gh reports {active_username or 'no active account'} instead of {target.username}")
 
     def handle_remove_account(self):
         account = self._selected_account()